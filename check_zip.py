@@ -4,13 +4,15 @@ import sys
 
 zip_path = r'C:\Users\maju\Downloads\ashish_personell-main (3).zip'
 search_pattern = 'Records/tabs'
+DOC_EXTS = ('.md',)
 
 try:
     with zipfile.ZipFile(zip_path, 'r') as zip_ref:
         found = False
-        for member in zip_ref.namelist():
-            if member.endswith('.md'):
-                print(member)
+        for info in zip_ref.infolist():
+            name = info.filename
+            if name.endswith(DOC_EXTS):
+                print(name)
                 found = True
         if not found:
             print("No files found in " + search_pattern)
@@ -12,5 +12,6 @@ try:
                 print(f"File: {member.filename}")
                 print(f"Size: {member.file_size}")
                 print(f"Date: {member.date_time}")
+                break
 except Exception as e:
     print(f"Error: {e}")
@@ -1,37 +1,98 @@
 
 import os
-
-paths = [
-    r'C:\Users\maju\AppData\Roaming\Code\User\History',
-    r'C:\Users\maju\AppData\Roaming\Cursor\User\History',
-    r'C:\Users\maju\AppData\Local\Code\User\History',
-    r'C:\Users\maju\AppData\Local\Cursor\User\History'
-]
+import sys
+import mmap
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from scan import scan_histories
 
 # Multiple search terms to catch different files
 search_terms = ["inline palti", "paltimodal", "enhancedpalti", "palti entries"]
-found = []
-
-print("Starting deep history search for code fragments...")
-
-for base in paths:
-    if not os.path.exists(base): continue
-    print(f"Scanning {base}...")
-    for root, dirs, files in os.walk(base):
-        for file in files:
-            if file == 'entries.json' or file.endswith('.png') or file.endswith('.jpg'): 
-                continue
-            
-            p = os.path.join(root, file)
-            try:
-                with open(p, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read().lower()
-                    for term in search_terms:
-                        if term in content:
-                            found.append((root, file, term))
-                            print(f"MATCH [{term}]: {p}")
-                            break
-            except:
-                continue
-
-print(f"\nFound {len(found)} potential history matches.")
+term_patterns = [(t, t.encode()) for t in search_terms]
+CHUNK_SIZE = 256
+SKIP_EXTS = ('.png', '.jpg')
+SNIFF_SIZE = 2048
+SNIFF_MIN_SIZE = 1 << 20
+WINDOW_SIZE = 1 << 20
+OVERLAP = max(len(t) for t in search_terms) - 1
+
+def iter_candidates():
+    for e in scan_histories(on_root=lambda root: print(f"Scanning {root}...", flush=True)):
+        if e.is_entries_json or e.size == 0 or e.path.endswith(SKIP_EXTS):
+            continue
+        yield e.path
+
+def chunked(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def scan_file(p):
+    fd = os.open(p, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return None
+        # Large fonts, packs and other binary blobs carry NULs early on; skip
+        # them before mapping and searching the whole file. Smaller files are
+        # always searched, since a NUL alone does not rule out a match.
+        if size > SNIFF_MIN_SIZE and b'\0' in os.read(fd, SNIFF_SIZE):
+            return None
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            # Lower one bounded window at a time instead of the whole body;
+            # windows overlap so a term spanning a boundary is still seen
+            for start in range(0, size, WINDOW_SIZE):
+                window = mm[start:start + WINDOW_SIZE + OVERLAP].lower()
+                for term, pattern in term_patterns:
+                    if window.find(pattern) != -1:
+                        return term
+    finally:
+        os.close(fd)
+    return None
+
+def scan_chunk(chunk):
+    hits = []
+    for p in chunk:
+        try:
+            term = scan_file(p)
+        except:
+            continue
+        if term:
+            hits.append((p, term))
+    return hits
+
+if __name__ == '__main__':
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    found = []
+    log = []
+
+    print("Starting deep history search for code fragments...", flush=True)
+
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # executor.map would drain the whole walk up front; keep only a few
+        # chunks in flight so the walk, the scans and the output advance together
+        chunks = chunked(iter_candidates(), CHUNK_SIZE)
+        pending = set()
+        while True:
+            for chunk in chunks:
+                pending.add(executor.submit(scan_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for p, term in future.result():
+                    found.append((p, term))
+                    log.append(f"MATCH [{term}]: {p}\n")
+            if log:
+                sys.stdout.write(''.join(log))
+                sys.stdout.flush()
+                log.clear()
+
+    print(f"\nFound {len(found)} potential history matches.")
@@ -1,6 +1,13 @@
 
 import os
+import sys
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from scan import iter_files
+
+sys.stdout.reconfigure(line_buffering=False, write_through=False)
 
 # Search Paths
 search_paths = [
@@ -12,33 +19,93 @@ target_recovery_dir = r'c:\Users\maju\Downloads\ashish_personell-main\RECOVERED_
 os.makedirs(target_recovery_dir, exist_ok=True)
 now = datetime.now()
 four_hours_ago = now - timedelta(hours=4)
+threshold_ts = four_hours_ago.timestamp()
 
-print(f"Deep Scanning for files modified after {four_hours_ago.strftime('%H:%M:%S')}...")
+print(f"Deep Scanning for files modified after {four_hours_ago.strftime('%H:%M:%S')}...", flush=True)
 
 found_count = 0
+prune_dirs = {'node_modules', '.git', '__pycache__', 'dist', 'build'}
+prune_local_dirs = {'Microsoft', 'Google', 'Packages'}
+
+def prune_dir(e):
+    # Skip node_modules, build output and big binary folders without ever
+    # listing them
+    if e.name in prune_dirs: return True
+    return e.name in prune_local_dirs and os.path.dirname(e.path).endswith('AppData\\Local')
+
+BATCH_SIZE = 4096
+LOG_FLUSH_EVERY = 256
+SOURCE_EXTS = ('.tsx', '.ts', '.js')
+
+def iter_sources():
+    for base in search_paths:
+        for e in iter_files(base, prune_dir):
+            if e.name.endswith(SOURCE_EXTS):
+                yield e
+
+def produce(batches):
+    # Walk on a separate thread so directory listing overlaps with stat().
+    # Any failure is handed to the consumer, and the sentinel always goes
+    # out so the main thread never waits forever.
+    try:
+        batch = []
+        for e in iter_sources():
+            batch.append(e)
+            if len(batch) == BATCH_SIZE:
+                batches.put(batch)
+                batch = []
+        if batch:
+            batches.put(batch)
+    except BaseException as exc:
+        batches.put(exc)
+    finally:
+        batches.put(None)
+
+def stat_entry(e):
+    try:
+        return e, e.stat(follow_symlinks=False)
+    except OSError:
+        return e, None
+
+def iter_stats():
+    # On Windows DirEntry.stat() is answered from the directory listing with
+    # no syscall, so there is nothing to overlap; walk and stat in one loop
+    if os.name == 'nt':
+        yield from map(stat_entry, iter_sources())
+        return
+    # Elsewhere each stat() is an lstat() that releases the GIL, so a walker
+    # thread feeds batches to a pool that overlaps them
+    batches = queue.Queue(maxsize=4)
+    threading.Thread(target=produce, args=(batches,), daemon=True).start()
+    with ThreadPoolExecutor(64) as pool:
+        while (batch := batches.get()) is not None:
+            if isinstance(batch, BaseException):
+                raise batch
+            yield from pool.map(stat_entry, batch)
+
+log = []
 
-for base in search_paths:
-    if not os.path.exists(base): continue
-    for root, dirs, files in os.walk(base):
-        # Skip node_modules and big binary folders to speed up
-        if 'node_modules' in root or 'AppData\\Local\\Microsoft' in root or 'AppData\\Local\\Google' in root:
-            continue
-            
-        for file in files:
-            if file.endswith('.tsx') or file.endswith('.ts') or file.endswith('.js'):
-                p = os.path.join(root, file)
-                try:
-                    mtime = os.path.getmtime(p)
-                    dt = datetime.fromtimestamp(mtime)
-                    if dt > four_hours_ago:
-                        size = os.path.getsize(p)
-                        print(f"FOUND: {p} ({size} bytes, {dt.strftime('%H:%M:%S')})")
-                        # Copy to recovery dir if it's a project file
-                        if size > 1000: # ignore very small files
-                             import shutil
-                             shutil.copy2(p, os.path.join(target_recovery_dir, f"DEEP_{dt.strftime('%H%M%S')}_{file}"))
-                             found_count += 1
-                except:
-                    continue
+for e, st in iter_stats():
+    if st is None: continue
+    file = e.name
+    p = e.path
+    try:
+        mtime = st.st_mtime
+        # Compare raw timestamps; only matches pay for a datetime
+        if mtime > threshold_ts:
+            dt = datetime.fromtimestamp(mtime)
+            size = st.st_size
+            log.append(f"FOUND: {p} ({size} bytes, {dt.strftime('%H:%M:%S')})\n")
+            if len(log) >= LOG_FLUSH_EVERY:
+                sys.stdout.write(''.join(log))
+                log.clear()
+            # Copy to recovery dir if it's a project file
+            if size > 1000: # ignore very small files
+                 import shutil
+                 shutil.copy2(p, os.path.join(target_recovery_dir, f"DEEP_{dt.strftime('%H%M%S')}_{file}"))
+                 found_count += 1
+    except:
+        continue
 
+sys.stdout.write(''.join(log))
 print(f"\nDeep Scan complete. Found {found_count} recent files.")
@@ -1,43 +1,39 @@
 
 import os
+import sys
+import heapq
 import shutil
 from datetime import datetime
+from scan import scan_histories
+
+sys.stdout.reconfigure(line_buffering=False, write_through=False)
 
-history_paths = [
-    r'C:\Users\maju\AppData\Roaming\Code\User\History',
-    r'C:\Users\maju\AppData\Roaming\Cursor\User\History',
-    r'C:\Users\maju\AppData\Local\Cursor\User\History'
-]
 target_recovery_dir = r'c:\Users\maju\Downloads\ashish_personell-main\RECOVERED_FILES'
 target_size = 599252
 
 os.makedirs(target_recovery_dir, exist_ok=True)
-print(f"Finding versions close to {target_size} bytes in ALL history paths...")
+print(f"Finding versions close to {target_size} bytes in ALL history paths...", flush=True)
 
 found = []
-for history_path in history_paths:
-    if not os.path.exists(history_path): continue
-    print(f"Scanning {history_path}...")
-    for root, dirs, files in os.walk(history_path):
-        for file in files:
-            if file == 'entries.json': continue
-            p = os.path.join(root, file)
-            try:
-                size = os.path.getsize(p)
-                if 550000 < size < 650000:
-                    with open(p, 'r', encoding='utf-8', errors='ignore') as f:
-                        header = f.read(1000)
-                        if 'import' in header and 'React' in header:
-                            mtime = os.path.getmtime(p)
-                            dt = datetime.fromtimestamp(mtime)
-                            found.append((dt, p, size))
-            except:
-                continue
-
-found.sort(key=lambda x: x[0], reverse=True)
+for e in scan_histories(on_root=lambda root: print(f"Scanning {root}...", flush=True)):
+    if e.is_entries_json: continue
+    # Size gate comes from the walk's stat, so only the few files inside
+    # the window are ever opened
+    if not 550000 < e.size < 650000: continue
+    try:
+        fd = os.open(e.path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            header = os.read(fd, 1000)
+        finally:
+            os.close(fd)
+        if b'import' in header and b'React' in header:
+            dt = datetime.fromtimestamp(e.mtime)
+            found.append((dt, e.path, e.size))
+    except:
+        continue
 
 print(f"\nFound {len(found)} candidate matches:")
-for dt, p, size in found[:10]:
+for dt, p, size in heapq.nlargest(10, found, key=lambda x: x[0]):
     print(f"[{dt.strftime('%H:%M:%S')}] {p} ({size} bytes)")
     shutil.copy2(p, os.path.join(target_recovery_dir, f"RECOVERED_{dt.strftime('%H%M%S')}_Records.tsx"))
 
@@ -0,0 +1,81 @@
+
+import os
+import atexit
+import pickle
+import tempfile
+from pathlib import Path
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+cache_path = Path('~/.cache/recover_history.pkl').expanduser()
+
+# entries_file -> (st_mtime_ns, st_size, resource_uri, entries)
+_cache = None
+_dirty = False
+
+def _load_cache():
+    global _cache
+    if _cache is None:
+        try:
+            with open(cache_path, 'rb') as f:
+                _cache = pickle.load(f)
+        except Exception:
+            _cache = {}
+        atexit.register(save_cache)
+    return _cache
+
+def save_cache():
+    global _dirty
+    if not _dirty: return
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # A per-writer temp file, so two scripts exiting together never
+    # interleave writes before the rename
+    f = tempfile.NamedTemporaryFile(dir=cache_path.parent, prefix=cache_path.name, delete=False)
+    try:
+        with f:
+            pickle.dump(_cache, f, protocol=5)
+        os.replace(f.name, cache_path)
+    except BaseException:
+        os.remove(f.name)
+        raise
+    _dirty = False
+
+def forget_missing(root, folders):
+    """Drop cached entries for folders under root that are not in folders,
+    the caller's fresh listing of root. Other roots are left alone."""
+    global _dirty
+    cache = _load_cache()
+    live = set(folders)
+    for key in list(cache):
+        folder = os.path.dirname(key)
+        if os.path.dirname(folder) == root and folder not in live:
+            del cache[key]
+            _dirty = True
+
+def load_entries(entries_file):
+    """Return (resource_uri, entries) for a history entries.json, reusing the
+    cached parse while the file's mtime and size are unchanged."""
+    global _dirty
+    cache = _load_cache()
+    try:
+        st = os.stat(entries_file)
+    except FileNotFoundError:
+        if cache.pop(entries_file, None) is not None:
+            _dirty = True
+        raise
+    hit = cache.get(entries_file)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2], hit[3]
+
+    with open(entries_file, 'rb') as f:
+        data = _loads(f.read())
+    uri = data.get('resource', '')
+    entries = data.get('entries', [])
+    cache[entries_file] = (st.st_mtime_ns, st.st_size, uri, entries)
+    _dirty = True
+    return uri, entries
@@ -1,52 +1,54 @@
 
 import os
-import json
+import sys
+import heapq
 import shutil
 from datetime import datetime
+from history_cache import forget_missing, load_entries
+
+sys.stdout.reconfigure(line_buffering=False, write_through=False)
 
 history_path = r'C:\Users\maju\AppData\Roaming\Code\User\History'
 target_recovery_dir = r'c:\Users\maju\Downloads\ashish_personell-main\RECOVERED_FILES'
 
-if not os.path.exists(history_path):
+try:
+    with os.scandir(history_path) as it:
+        folders = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+    forget_missing(history_path, folders)
+except FileNotFoundError:
     print(f"Path not found: {history_path}")
     exit(1)
 
 os.makedirs(target_recovery_dir, exist_ok=True)
 
-print(f"Searching VS Code History at {history_path}...")
+print(f"Searching VS Code History at {history_path}...", flush=True)
 
 found_files = []
+seen_uris = set()
 
-for folder in os.listdir(history_path):
-    folder_path = os.path.join(history_path, folder)
-    if not os.path.isdir(folder_path): continue
-    
-    entries_file = os.path.join(folder_path, 'entries.json')
-    if not os.path.exists(entries_file): continue
-    
+for folder_path in folders:
+    # Folders without an entries.json raise FileNotFoundError from the one
+    # stat load_entries already does
     try:
-        with open(entries_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            resource_uri = data.get('resource')
-            
-                # Just list all unique project URIs found to help identify the correct one
-                if resource_uri not in [x[1] for x in found_files]:
-                     entries = data.get('entries', [])
-                     if entries:
-                         latest = max(entries, key=lambda x: x.get('timestamp', 0))
-                         ts = latest.get('timestamp') / 1000
-                         dt = datetime.fromtimestamp(ts)
-                         file_id = latest.get('id')
-                         source_file = os.path.join(folder_path, file_id)
-                         if os.path.exists(source_file):
-                             found_files.append((dt, resource_uri, source_file))
-
-# Sort by most recent
-found_files.sort(key=lambda x: x[0], reverse=True)
+        resource_uri, entries = load_entries(os.path.join(folder_path, 'entries.json'))
+    except:
+        continue
+
+    # Just list all unique project URIs found to help identify the correct one
+    if resource_uri not in seen_uris:
+        if entries:
+            latest = max(entries, key=lambda x: x.get('timestamp', 0))
+            ts = latest.get('timestamp') / 1000
+            dt = datetime.fromtimestamp(ts)
+            file_id = latest.get('id')
+            source_file = os.path.join(folder_path, file_id)
+            if os.path.exists(source_file):
+                seen_uris.add(resource_uri)
+                found_files.append((dt, resource_uri, source_file, os.path.basename(resource_uri)))
 
 print(f"\nFound {len(found_files)} unique project files in History:")
-for dt, uri, src in found_files[:50]:
-    basename = os.path.basename(uri)
+# Most recent 50 without sorting the whole list
+for dt, uri, src, basename in heapq.nlargest(50, found_files, key=lambda x: x[0]):
     print(f"[{dt.strftime('%Y-%m-%d %H:%M:%S')}] {basename} ({uri})")
     
     # Copy to recovery dir
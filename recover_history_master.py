@@ -1,56 +1,69 @@
 
 import os
-import json
+import sys
+import heapq
 import shutil
 from datetime import datetime, timedelta
+from history_cache import forget_missing, load_entries
+
+sys.stdout.reconfigure(line_buffering=False, write_through=False)
 
 history_path = r'C:\Users\maju\AppData\Roaming\Code\User\History'
 target_recovery_dir = r'c:\Users\maju\Downloads\ashish_personell-main\RECOVERED_FILES'
 
 os.makedirs(target_recovery_dir, exist_ok=True)
-print(f"Searching VS Code History at {history_path}...")
+print(f"Searching VS Code History at {history_path}...", flush=True)
+
+def fast_copy(src, dst):
+    # Recovered files must stay independent of the history snapshot (often
+    # the only surviving copy), so always copy; on Windows let the kernel's
+    # CopyFileExW do it instead of streaming through Python buffers
+    if os.name == 'nt':
+        import ctypes
+        if ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, 0):
+            st = os.stat(src)
+            os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+            return
+    shutil.copy2(src, dst)
 
 found_files = []
 now = datetime.now()
 limit = now - timedelta(days=7)
 
-if not os.path.exists(history_path):
+try:
+    with os.scandir(history_path) as it:
+        folders = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+    forget_missing(history_path, folders)
+except FileNotFoundError:
     print("History path not found.")
     exit(1)
 
-for folder in os.listdir(history_path):
-    folder_path = os.path.join(history_path, folder)
-    if not os.path.isdir(folder_path): continue
-    
-    entries_file = os.path.join(folder_path, 'entries.json')
-    if not os.path.exists(entries_file): continue
-    
+for folder_path in folders:
     try:
-        with open(entries_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            uri = data.get('resource', '')
+        # A missing entries.json surfaces as FileNotFoundError here
+        uri, entries = load_entries(os.path.join(folder_path, 'entries.json'))
+        basename = os.path.basename(uri)
+        for entry in entries:
+            ts = entry.get('timestamp', 0) / 1000
+            dt = datetime.fromtimestamp(ts)
             
-            entries = data.get('entries', [])
-            for entry in entries:
-                ts = entry.get('timestamp', 0) / 1000
-                dt = datetime.fromtimestamp(ts)
-                
-                if dt > limit:
-                    file_id = entry.get('id')
-                    src = os.path.join(folder_path, file_id)
-                    if os.path.exists(src):
-                        found_files.append((dt, uri, src))
+            if dt > limit:
+                file_id = entry.get('id')
+                src = os.path.join(folder_path, file_id)
+                if os.path.exists(src):
+                    found_files.append((dt, uri, src, basename))
     except:
         continue
 
-found_files.sort(key=lambda x: x[0], reverse=True)
-
 print(f"Found {len(found_files)} entries from the last 7 days.")
-for dt, uri, src in found_files[:100]:
-    basename = os.path.basename(uri)
+copied = set()
+for dt, uri, src, basename in heapq.nlargest(100, found_files, key=lambda x: x[0]):
     print(f"[{dt.strftime('%m-%d %H:%M')}] {basename}  ({uri})")
     
     safe_name = f"{dt.strftime('%m%d_%H%M%S')}_{basename}"
-    shutil.copy2(src, os.path.join(target_recovery_dir, safe_name))
+    # Same second + same file name maps to one destination; keep the first
+    if safe_name in copied: continue
+    copied.add(safe_name)
+    fast_copy(src, os.path.join(target_recovery_dir, safe_name))
 
 print(f"\nSearch complete. Files are in: {target_recovery_dir}")
@@ -0,0 +1,60 @@
+
+import os
+from collections import namedtuple
+
+HISTORY_PATHS = [
+    r'C:\Users\maju\AppData\Roaming\Code\User\History',
+    r'C:\Users\maju\AppData\Roaming\Cursor\User\History',
+    r'C:\Users\maju\AppData\Local\Code\User\History',
+    r'C:\Users\maju\AppData\Local\Cursor\User\History'
+]
+
+FileEntry = namedtuple('FileEntry', 'path size mtime is_entries_json')
+
+def iter_files(root, prune=None):
+    """Yield a DirEntry for every file under root. Directories for which
+    prune(entry) is true are not entered, and symlinks to directories are
+    skipped. Like os.walk, a directory that cannot be listed is skipped
+    rather than aborting the walk."""
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        while True:
+            try:
+                e = next(it)
+            except StopIteration:
+                break
+            except OSError:
+                return
+            try:
+                is_dir = e.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if prune and prune(e): continue
+                yield from iter_files(e.path, prune)
+                continue
+            try:
+                # A symlink to a directory is neither entered nor a file
+                if e.is_dir():
+                    continue
+            except OSError:
+                pass
+            yield e
+
+def scan_histories(paths=HISTORY_PATHS, on_root=None):
+    """Yield a FileEntry for every file under the history roots, stat'ing
+    each file once from its DirEntry. on_root(root) is called before each
+    existing root is walked, for progress output."""
+    for root in paths:
+        if on_root and os.path.isdir(root):
+            on_root(root)
+        # A missing root just yields nothing from iter_files
+        for e in iter_files(root):
+            try:
+                st = e.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            yield FileEntry(e.path, st.st_size, st.st_mtime, e.name == 'entries.json')
@@ -1,58 +1,76 @@
 
 import os
-import json
+import re
+import sys
 import shutil
 from datetime import datetime
+from history_cache import forget_missing, load_entries
+from scan import HISTORY_PATHS, scan_histories
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+sys.stdout.reconfigure(line_buffering=False, write_through=False)
 
-history_paths = [
-    r'C:\Users\maju\AppData\Roaming\Code\User\History',
-    r'C:\Users\maju\AppData\Roaming\Cursor\User\History',
-    r'C:\Users\maju\AppData\Local\Cursor\User\History',
-    r'C:\Users\maju\AppData\Local\Code\User\History'
-]
 target_recovery_dir = r'c:\Users\maju\Downloads\ashish_personell-main\RECOVERED_FILES'
-target_filename = 'Records.tsx'
+target_filenames = ['Records.tsx']
+
+# Match every target in one pass over each resource URI
+if ahocorasick:
+    target_automaton = ahocorasick.Automaton()
+    for t in target_filenames:
+        target_automaton.add_word(t.casefold(), t)
+    target_automaton.make_automaton()
+
+    def match_target(uri):
+        return next((t for _, t in target_automaton.iter(uri.casefold())), None)
+else:
+    target_pattern = re.compile('|'.join(re.escape(t) for t in target_filenames), re.IGNORECASE)
+
+    def match_target(uri):
+        return target_pattern.search(uri)
 
 os.makedirs(target_recovery_dir, exist_ok=True)
-print(f"Searching for all versions of {target_filename} in multiple history paths...")
+print(f"Searching for all versions of {', '.join(target_filenames)} in multiple history paths...", flush=True)
 
 found_files = []
 
-for history_path in history_paths:
-    if not os.path.exists(history_path): continue
-    print(f"Checking {history_path}...")
-    for folder in os.listdir(history_path):
-        folder_path = os.path.join(history_path, folder)
-        if not os.path.isdir(folder_path): continue
-        
-        entries_file = os.path.join(folder_path, 'entries.json')
-        if not os.path.exists(entries_file): continue
-        
+for history_path in HISTORY_PATHS:
+    try:
+        with os.scandir(history_path) as it:
+            folders = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+    except OSError:
+        continue
+    forget_missing(history_path, folders)
+    print(f"Checking {history_path}...", flush=True)
+    for folder_path in folders:
         try:
-            with open(entries_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                resource_uri = data.get('resource', '')
-                
-                if target_filename.lower() in resource_uri.lower():
-                    entries = data.get('entries', [])
-                    for entry in entries:
-                        ts = entry.get('timestamp', 0) / 1000
-                        dt = datetime.fromtimestamp(ts)
-                        file_id = entry.get('id')
-                        src = os.path.join(folder_path, file_id)
-                        if os.path.exists(src):
-                            size = os.path.getsize(src)
-                            found_files.append((dt, resource_uri, src, size))
+            resource_uri, entries = load_entries(os.path.join(folder_path, 'entries.json'))
+            
+            if match_target(resource_uri):
+                basename = os.path.basename(resource_uri)
+                # Only folders for a matching file get their snapshots stat'd
+                sizes = {e.path: e.size for e in scan_histories([folder_path])}
+                for entry in entries:
+                    ts = entry.get('timestamp', 0) / 1000
+                    dt = datetime.fromtimestamp(ts)
+                    file_id = entry.get('id')
+                    src = os.path.join(folder_path, file_id)
+                    size = sizes.get(src)
+                    if size is None: continue
+                    found_files.append((dt, resource_uri, src, size, basename))
         except:
             continue
 
 found_files.sort(key=lambda x: x[0], reverse=True)
 
 print(f"Found {len(found_files)} versions:")
-for dt, uri, src, size in found_files:
+for dt, uri, src, size, basename in found_files:
     # Print everything so I can find the 599KB version
     print(f"[{dt.strftime('%m-%d %H:%M:%S')}] {size} bytes - {uri}")
-    safe_name = f"REV_{dt.strftime('%m%d_%H%M%S')}_{size}_{os.path.basename(uri)}"
+    safe_name = f"REV_{dt.strftime('%m%d_%H%M%S')}_{size}_{basename}"
     shutil.copy2(src, os.path.join(target_recovery_dir, safe_name))
 
 print(f"\nResults copied to: {target_recovery_dir}")